@@ -1,6 +1,5 @@
+import functools
 import math
-import matplotlib.pyplot as plt
-from matplotlib.widgets import Slider
 import numpy as np
 
 """
@@ -37,15 +36,63 @@ l1 = 12  # First link length (cm)
 l2 = 12  # Second link length (cm) 
 l3 = 12  # Third link length (cm)
 
+# Link lengths as an array for vectorized kinematics
+link_lengths = np.array([l1, l2, l3], dtype=np.float64)
+
 # Calculate derived parameters
 total_reach = l1 + l2 + l3  # Maximum possible reach
 plot_limit = total_reach + 10  # Plot boundaries
 
+#===============================================================================
+# TRIGONOMETRIC LOOKUP TABLE
+#===============================================================================
+
+# Cosine/sine of every whole degree in [-540, 540], which covers the
+# cumulative angle of three joints limited to [-180, 180] each. Kept as
+# Python lists: indexing a list with a scalar is much cheaper than indexing
+# a numpy array
+_ANGLE_OFFSET = 540
+_COS = np.cos(np.deg2rad(np.arange(-_ANGLE_OFFSET, _ANGLE_OFFSET + 1, dtype=np.float64))).tolist()
+_SIN = np.sin(np.deg2rad(np.arange(-_ANGLE_OFFSET, _ANGLE_OFFSET + 1, dtype=np.float64))).tolist()
+_TABLE_SIZE = len(_COS)
+
+def _link_cos_sin(alpha, beta, gamma):
+    """
+    Cosine and sine of the cumulative link angles alpha, alpha + beta and
+    alpha + beta + gamma (all in degrees), as two tuples of floats.
+    """
+    
+    # Fast path: integer angles whose cumulative sums fall inside the table.
+    # The type check is the cheapest test that lets non-integer angles skip
+    # straight to the math functions below
+    if type(alpha) is int and type(beta) is int and type(gamma) is int:
+        i1 = alpha + _ANGLE_OFFSET
+        i2 = i1 + beta
+        i3 = i2 + gamma
+        if 0 <= i1 < _TABLE_SIZE and 0 <= i2 < _TABLE_SIZE and 0 <= i3 < _TABLE_SIZE:
+            return (_COS[i1], _COS[i2], _COS[i3]), (_SIN[i1], _SIN[i2], _SIN[i3])
+    
+    # Otherwise evaluate each joint once and build the cumulative angles
+    # with the angle-addition identities
+    alpha_rad = math.radians(alpha)
+    beta_rad = math.radians(beta)
+    gamma_rad = math.radians(gamma)
+    ca, sa = math.cos(alpha_rad), math.sin(alpha_rad)
+    cb, sb = math.cos(beta_rad), math.sin(beta_rad)
+    cg, sg = math.cos(gamma_rad), math.sin(gamma_rad)
+    
+    cab = ca * cb - sa * sb     # cos(alpha + beta)
+    sab = sa * cb + ca * sb     # sin(alpha + beta)
+    cabg = cab * cg - sab * sg  # cos(alpha + beta + gamma)
+    sabg = sab * cg + cab * sg  # sin(alpha + beta + gamma)
+    
+    return (ca, cab, cabg), (sa, sab, sabg)
+
 #===============================================================================
 # FORWARD KINEMATICS CALCULATION
 #===============================================================================
 
-def calculate_arm_position(alpha, beta, gamma):
+def calculate_arm_position(alpha, beta, gamma, out=None):
     """
     Calculate forward kinematics for the robotic arm.
     
@@ -57,55 +104,236 @@ def calculate_arm_position(alpha, beta, gamma):
         Second joint angle (θ2) in degrees  
     gamma : float
         Third joint angle (θ3) in degrees
+    out : numpy.ndarray, optional
+        (2, 4) buffer that receives the x (row 0) and y (row 1) coordinates
+        of each joint; arm_x and arm_y are then views of its rows
         
     Returns:
     --------
     tuple: (arm_x, arm_y, end_effector_angle, distance_to_end)
-        arm_x, arm_y: lists of x,y coordinates for each joint
+        arm_x, arm_y: numpy arrays of x,y coordinates for each joint
         end_effector_angle: final orientation in degrees
         distance_to_end: distance from base to end-effector
+    
+    Angles are quantized to whole degrees (the precision shown on the
+    sliders) so that repeated slider events are served from a cache.
     """
     
-    # Convert angles to radians for trigonometric calculations
-    alpha_rad = math.radians(alpha)
-    beta_rad = math.radians(beta)
-    gamma_rad = math.radians(gamma)
+    arm_x, arm_y, end_effector_angle, distance_to_end = _calc_arm_cached(
+        int(round(alpha)), int(round(beta)), int(round(gamma)))
+    
+    if out is not None:
+        out[0] = arm_x
+        out[1] = arm_y
+        arm_x, arm_y = out[0], out[1]
+    
+    return arm_x, arm_y, end_effector_angle, distance_to_end
+
+@functools.lru_cache(maxsize=512)
+def _calc_arm_cached(alpha, beta, gamma):
+    """Cached forward kinematics for integer-degree joint angles."""
     
-    # Joint 1 position (end of first link)
-    x1 = x0 + l1 * math.cos(alpha_rad)
-    y1 = y0 + l1 * math.sin(alpha_rad)
+    # Cumulative link angles: each joint adds to the previous one
+    cos_theta, sin_theta = _link_cos_sin(alpha, beta, gamma)
     
-    # Joint 2 position (end of second link)
-    # Angle accumulates: first link angle + second link angle
-    x2 = x1 + l2 * math.cos(alpha_rad + beta_rad)
-    y2 = y1 + l2 * math.sin(alpha_rad + beta_rad)
+    # Per-link displacement vectors, evaluated for all links at once
+    dx = link_lengths * cos_theta
+    dy = link_lengths * sin_theta
     
-    # End-effector position (end of third link)
-    # Angle accumulates: sum of all joint angles
-    x3 = x2 + l3 * math.cos(alpha_rad + beta_rad + gamma_rad)
-    y3 = y2 + l3 * math.sin(alpha_rad + beta_rad + gamma_rad)
+    # Joint positions: base followed by the running sum of link displacements
+    arm_x = np.concatenate(([x0], x0 + dx.cumsum()))
+    arm_y = np.concatenate(([y0], y0 + dy.cumsum()))
     
     # Calculate distance from base to end-effector
-    distance_to_end = math.sqrt((x0 - x3)**2 + (y0 - y3)**2)
+    distance_to_end = math.hypot(arm_x[-1] - x0, arm_y[-1] - y0)
     
     # Final orientation angle of the end-effector
     end_effector_angle = alpha + beta + gamma
     
-    # Return coordinates and metrics
-    arm_x = [x0, x1, x2, x3]
-    arm_y = [y0, y1, y2, y3]
+    # Cached arrays are shared between callers, so protect them from mutation
+    arm_x.setflags(write=False)
+    arm_y.setflags(write=False)
     
     return arm_x, arm_y, end_effector_angle, distance_to_end
 
+#===============================================================================
+# COMPACT JOINT SLIDER PANEL
+#===============================================================================
+
+class JointSliderPanel:
+    """
+    A stack of horizontal sliders drawn on a single matplotlib Axes.
+    
+    Replaces one Slider widget (and one Axes) per joint: the tracks, value
+    bars and handles of all rows are shared collections, so the panel adds
+    a single Axes to the figure's draw tree. The interface follows the stock
+    Slider, adapted to several values:
+    
+    - val is a list with one value per row
+    - set_val(index, value) sets the value of row `index`
+    - reset() restores all rows at once and notifies observers once
+    - observers connected with on_changed(func) are called as func(values),
+      where values is a tuple holding the value of every row
+    - drawon controls whether a change requests a canvas redraw
+    
+    Parameters:
+    -----------
+    ax : matplotlib.axes.Axes
+        Axes hosting the panel; rows are stacked top to bottom
+    labels : list of str
+        Row labels, one per slider
+    valmin, valmax : float
+        Value range shared by all sliders
+    valinit : list of float
+        Initial value of each slider
+    valfmt : str
+        %-format used for the value displayed to the right of each row
+    """
+    
+    def __init__(self, ax, labels, valmin, valmax, valinit, valfmt='%.2f'):
+        from matplotlib.collections import PolyCollection
+        
+        self.ax = ax
+        self.valmin = valmin
+        self.valmax = valmax
+        self.valinit = list(valinit)
+        self.val = list(valinit)
+        self.valfmt = valfmt
+        self.drawon = True
+        self._observers = {}
+        self._next_cid = 0
+        self._active_row = None
+        
+        # Row i is centred at y = n - 1 - i so the first slider is on top
+        n = len(labels)
+        self._rows_y = np.arange(n - 1, -1, -1, dtype=np.float64)
+        self._half_height = 0.15
+        
+        ax.set_xlim(valmin, valmax)
+        ax.set_ylim(-0.5, n - 0.5)
+        ax.set_axis_off()
+        ax.set_navigate(False)
+        
+        # Static tracks, value bars and handles: one collection each
+        self._tracks = ax.add_collection(PolyCollection(
+            [self._bar_verts(y, valmax) for y in self._rows_y],
+            facecolors='lightgrey', edgecolors='none'))
+        self._bars = ax.add_collection(PolyCollection(
+            [self._bar_verts(y, v) for y, v in zip(self._rows_y, self.val)],
+            facecolors='C0', edgecolors='none'))
+        self._handles = ax.scatter(self.val, self._rows_y, s=10**2,
+                                   facecolors='white', edgecolors='0.75',
+                                   clip_on=False, zorder=3)
+        
+        # Labels on the left, current values on the right of each row
+        row_transform = ax.get_yaxis_transform()
+        for y, label in zip(self._rows_y, labels):
+            ax.text(-0.02, y, label, transform=row_transform,
+                    ha='right', va='center')
+        self._valtexts = [ax.text(1.02, y, valfmt % v, transform=row_transform,
+                                  ha='left', va='center')
+                          for y, v in zip(self._rows_y, self.val)]
+        
+        # Artists that change with the values; a blitting GUI can mark these
+        # animated so its cached background keeps only tracks and labels
+        self.dynamic_artists = [self._bars, self._handles, *self._valtexts]
+        
+        canvas = ax.figure.canvas
+        canvas.mpl_connect('button_press_event', self._on_press)
+        canvas.mpl_connect('button_release_event', self._on_release)
+        canvas.mpl_connect('motion_notify_event', self._on_motion)
+    
+    def _bar_verts(self, y, value):
+        """Rectangle from valmin to value on the row centred at y."""
+        h = self._half_height
+        return [(self.valmin, y - h), (self.valmin, y + h),
+                (value, y + h), (value, y - h)]
+    
+    def _value_from_event(self, event):
+        """Slider value under the mouse, clamped to the slider range."""
+        x = float(self.ax.transData.inverted().transform((event.x, event.y))[0])
+        return min(max(x, self.valmin), self.valmax)
+    
+    def _on_press(self, event):
+        if event.inaxes is not self.ax or event.button != 1:
+            return
+        if not event.canvas.widgetlock.available(self):
+            return
+        
+        # Pick the row nearest to the click; hold the widget lock for the
+        # duration of the drag so other widgets and the toolbar stay idle
+        self._active_row = int(np.abs(self._rows_y - event.ydata).argmin())
+        event.canvas.widgetlock(self)
+        event.canvas.grab_mouse(self.ax)
+        self.set_val(self._active_row, self._value_from_event(event))
+    
+    def _on_motion(self, event):
+        if self._active_row is not None:
+            self.set_val(self._active_row, self._value_from_event(event))
+    
+    def _on_release(self, event):
+        if self._active_row is not None:
+            self._active_row = None
+            event.canvas.release_mouse(self.ax)
+            event.canvas.widgetlock.release(self)
+    
+    def _changed(self):
+        """Refresh the panel artists and notify observers of new values."""
+        self._bars.set_verts([self._bar_verts(y, v)
+                              for y, v in zip(self._rows_y, self.val)])
+        self._handles.set_offsets(np.column_stack([self.val, self._rows_y]))
+        for valtext, v in zip(self._valtexts, self.val):
+            valtext.set_text(self.valfmt % v)
+        
+        if self.drawon:
+            self.ax.figure.canvas.draw_idle()
+        values = tuple(self.val)
+        for func in list(self._observers.values()):
+            func(values)
+    
+    def set_val(self, index, value):
+        """Set the value of slider `index` and notify observers."""
+        if value != self.val[index]:
+            self.val[index] = value
+            self._changed()
+    
+    def reset(self):
+        """Reset all sliders to their initial values, notifying once."""
+        if self.val != self.valinit:
+            self.val = list(self.valinit)
+            self._changed()
+    
+    def on_changed(self, func):
+        """Connect func(values) to value changes; returns a connection id."""
+        cid = self._next_cid
+        self._next_cid += 1
+        self._observers[cid] = func
+        return cid
+    
+    def disconnect(self, cid):
+        """Remove the observer with connection id cid."""
+        self._observers.pop(cid, None)
+
 #===============================================================================
 # INTERACTIVE VISUALIZATION
 #===============================================================================
 
+def _arm_segments(joints):
+    """Convert a (2, N) joint coordinates array into N-1 link segments."""
+    points = joints.T
+    return np.stack([points[:-1], points[1:]], axis=1)
+
 def create_interactive_arm():
     """
     Create the interactive robotic arm simulator with matplotlib sliders.
     """
     
+    # Matplotlib is only needed for the GUI, so the kinematics functions can be
+    # imported without paying for the plotting stack
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    from matplotlib.widgets import Button
+    
     # Create figure and axis
     fig, ax = plt.subplots(figsize=(12, 8))
     plt.subplots_adjust(bottom=0.25)  # Make room for sliders
@@ -115,15 +343,23 @@ def create_interactive_arm():
     beta_init = 0
     gamma_init = 0
     
-    # Calculate initial arm position
-    arm_x, arm_y, end_angle, distance = calculate_arm_position(alpha_init, beta_init, gamma_init)
+    # Joint coordinates buffer (row 0: x, row 1: y), reused on every update
+    joints = np.empty((2, 4))
     
-    # Create initial plot
-    line, = ax.plot(arm_x, arm_y, '-o', 
-                   linewidth=3, 
-                   markersize=8, 
-                   color='royalblue',
-                   label='Arm links')
+    # Calculate initial arm position
+    arm_x, arm_y, end_angle, distance = calculate_arm_position(
+        alpha_init, beta_init, gamma_init, out=joints)
+    
+    # Create initial plot: links as one batched collection, joints as markers
+    arm_links = LineCollection(_arm_segments(joints),
+                               linewidths=3,
+                               colors='royalblue',
+                               label='Arm links')
+    ax.add_collection(arm_links)
+    arm_joints = ax.scatter(arm_x, arm_y,
+                            s=8**2,
+                            color='royalblue',
+                            zorder=2)
     
     # Base marker
     base_point, = ax.plot(x0, y0, 'o', 
@@ -147,29 +383,67 @@ def create_interactive_arm():
     ax.legend()
     
     # Title (will be updated)
-    title = ax.set_title(f"3-DOF Robotic Arm Simulator\n"
-                        f"End-effector: ({arm_x[-1]:.2f}, {arm_y[-1]:.2f}) cm\n"
-                        f"Distance: {distance:.2f} cm | Orientation: {end_angle:.1f}°")
+    title_template = ("3-DOF Robotic Arm Simulator\n"
+                      "End-effector: (%.2f, %.2f) cm\n"
+                      "Distance: %.2f cm | Orientation: %.1f°")
+    last_title = title_template % (arm_x[-1], arm_y[-1], distance, end_angle)
+    title = ax.set_title(last_title)
     
     #===========================================================================
-    # CREATE SLIDERS
+    # BLITTING SETUP
     #===========================================================================
     
-    # Define slider positions [left, bottom, width, height]
-    slider_height = 0.03
-    slider_spacing = 0.05
+    # Slider events only redraw the moving artists; the static parts of the
+    # figure are restored from a background cached after each full draw
+    canvas = fig.canvas
+    use_blit = canvas.supports_blit
+    animated_artists = [arm_links, arm_joints, end_point, title]
+    background = None
+    
+    def draw_animated():
+        """Draw the artists that are excluded from the cached background."""
+        for artist in animated_artists:
+            ax.draw_artist(artist)
+    
+    def on_draw(event):
+        """Refresh the cached background after every full redraw (e.g. resize)."""
+        nonlocal background
+        if event.canvas is not canvas:
+            # savefig to another format renders through a temporary canvas:
+            # include the animated artists, but keep the cached background
+            for artist in animated_artists:
+                artist.draw(event.renderer)
+            return
+        background = canvas.copy_from_bbox(fig.bbox)
+        draw_animated()
+    
+    # Without blit support nothing is animated and updates use draw_idle()
+    if use_blit:
+        canvas.mpl_connect('draw_event', on_draw)
+    
+    #===========================================================================
+    # CREATE SLIDERS
+    #===========================================================================
     
-    ax_alpha = plt.axes([0.15, 0.15, 0.5, slider_height])
-    ax_beta = plt.axes([0.15, 0.10, 0.5, slider_height])
-    ax_gamma = plt.axes([0.15, 0.05, 0.5, slider_height])
+    # One Axes hosts all three sliders [left, bottom, width, height];
+    # each row is 0.05 tall, centred where the individual sliders used to be
+    ax_sliders = plt.axes([0.15, 0.04, 0.5, 0.15])
     
     # Create sliders
-    slider_alpha = Slider(ax_alpha, 'α (Joint 1)', -180, 180, 
-                         valinit=alpha_init, valfmt='%.0f°')
-    slider_beta = Slider(ax_beta, 'β (Joint 2)', -180, 180, 
-                        valinit=beta_init, valfmt='%.0f°')
-    slider_gamma = Slider(ax_gamma, 'γ (Joint 3)', -180, 180, 
-                         valinit=gamma_init, valfmt='%.0f°')
+    joint_sliders = JointSliderPanel(ax_sliders,
+                                     ['α (Joint 1)', 'β (Joint 2)', 'γ (Joint 3)'],
+                                     -180, 180,
+                                     valinit=[alpha_init, beta_init, gamma_init],
+                                     valfmt='%.0f°')
+    
+    # The slider bars, handles and values are redrawn together with the arm
+    # instead of forcing a full draw. They must be animated too: the panel has
+    # no opaque background, so drawing them over the cached background would
+    # leave the previous handle positions and values visible
+    joint_sliders.drawon = not use_blit
+    animated_artists.extend(joint_sliders.dynamic_artists)
+    for artist in animated_artists:
+        artist.set_animated(use_blit)
     
     #===========================================================================
     # UPDATE FUNCTION
@@ -179,49 +453,74 @@ def create_interactive_arm():
         """
         Update the arm visualization when sliders change.
         """
+        nonlocal last_title
+        
         # Get current slider values
-        alpha = slider_alpha.val
-        beta = slider_beta.val
-        gamma = slider_gamma.val
+        alpha, beta, gamma = joint_sliders.val
         
         # Calculate new arm position
-        arm_x, arm_y, end_angle, distance = calculate_arm_position(alpha, beta, gamma)
+        arm_x, arm_y, end_angle, distance = calculate_arm_position(
+            alpha, beta, gamma, out=joints)
         
-        # Update arm line
-        line.set_xdata(arm_x)
-        line.set_ydata(arm_y)
+        # Update arm links and joints
+        arm_links.set_segments(_arm_segments(joints))
+        arm_joints.set_offsets(joints.T)
         
         # Update end-effector marker
-        end_point.set_xdata([arm_x[-1]])
-        end_point.set_ydata([arm_y[-1]])
+        end_point.set_data([arm_x[-1]], [arm_y[-1]])
         
-        # Update title with current values
-        title.set_text(f"3-DOF Robotic Arm Simulator\n"
-                      f"End-effector: ({arm_x[-1]:.2f}, {arm_y[-1]:.2f}) cm\n"
-                      f"Distance: {distance:.2f} cm | Orientation: {end_angle:.1f}°")
+        # Update title with current values (only when the displayed text changes)
+        new_title = title_template % (arm_x[-1], arm_y[-1], distance, end_angle)
+        if new_title != last_title:
+            title.set_text(new_title)
+            last_title = new_title
         
         # Redraw the plot
-        fig.canvas.draw_idle()
+        if background is None:
+            canvas.draw_idle()
+        else:
+            canvas.restore_region(background)
+            draw_animated()
+            canvas.blit(fig.bbox)
+    
+    #===========================================================================
+    # EVENT THROTTLING
+    #===========================================================================
+    
+    # Sliders fire on every pixel of a drag; coalesce those events so the arm
+    # is redrawn at most once per display frame (~60 Hz)
+    update_pending = False
+    
+    def run_pending_update():
+        """Timer callback: apply the latest slider values."""
+        nonlocal update_pending
+        update_pending = False
+        update_arm(None)
+    
+    update_timer = canvas.new_timer(interval=16)
+    update_timer.single_shot = True
+    update_timer.add_callback(run_pending_update)
+    
+    def schedule_update(val):
+        """Defer the arm update to the next frame boundary."""
+        nonlocal update_pending
+        if not update_pending:
+            update_pending = True
+            update_timer.start()
     
     # Connect sliders to update function
-    slider_alpha.on_changed(update_arm)
-    slider_beta.on_changed(update_arm)
-    slider_gamma.on_changed(update_arm)
+    joint_sliders.on_changed(schedule_update)
     
     #===========================================================================
     # ADD RESET BUTTON
     #===========================================================================
     
-    from matplotlib.widgets import Button
-    
     ax_reset = plt.axes([0.75, 0.15, 0.15, 0.08])
     button_reset = Button(ax_reset, 'Reset Arm')
     
     def reset_arm(event):
         """Reset all sliders to zero position."""
-        slider_alpha.reset()
-        slider_beta.reset()
-        slider_gamma.reset()
+        joint_sliders.reset()
     
     button_reset.on_clicked(reset_arm)
     
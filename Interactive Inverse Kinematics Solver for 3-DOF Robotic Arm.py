@@ -1,8 +1,20 @@
+import functools
 import math
-import matplotlib.pyplot as plt
-from matplotlib.widgets import TextBox, Button
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the solver runs as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+try:
+    # Optional ahead-of-time compiled kernels, built from _arm_kinematics.pyx
+    import _arm_kinematics as _compiled_kinematics
+except ImportError:
+    _compiled_kinematics = None
+
 """
 Interactive Inverse Kinematics Solver for 3-DOF Robotic Arm
 
@@ -46,6 +58,22 @@ max_reach = l1 + l2 + l3  # Maximum reach (fully extended)
 min_reach = abs(l1 - l2) + l3  # Minimum reach (folded configuration)
 plot_limit = max_reach + 10  # Plot boundaries
 
+# Link-length terms of the inverse kinematics closed form, computed once
+_L1_SQ = l1**2
+_L2_SQ = l2**2
+_TWO_L1L2 = 2 * l1 * l2
+_REACH_MAX = l1 + l2       # Farthest wrist position reachable by the first two links
+_REACH_MIN = abs(l1 - l2)  # Closest wrist position reachable by the first two links
+
+# Geometry arguments of the scalar IK kernel, in call order
+_IK_GEOMETRY = (x0, y0, l1, l2, l3, _REACH_MAX, _REACH_MIN, _L1_SQ, _L2_SQ, _TWO_L1L2)
+
+# Inverse kinematics status codes
+IK_OK = 0         # Solution found
+IK_TOO_FAR = 1    # Wrist beyond reach of the first two links
+IK_TOO_CLOSE = 2  # Wrist inside the inner dead zone of the first two links
+IK_SINGULAR = 3   # Wrist at the base - singular configuration
+
 #===============================================================================
 # INVERSE KINEMATICS SOLVER
 #===============================================================================
@@ -67,105 +95,319 @@ def solve_inverse_kinematics(px, py, phi_deg):
     --------
     tuple: (alpha_deg, beta_deg, gamma_deg, success, error_msg)
         Joint angles in degrees, success flag, and error message
+    
+    The target is quantized to 0.01 cm and 0.1° so that repeated requests
+    for the same pose are served from a cache.
     """
     
+    return _solve_ik_cached(round(px, 2), round(py, 2), round(phi_deg, 1))
+
+@functools.lru_cache(maxsize=512)
+def _solve_ik_cached(px, py, phi_deg):
+    """Cached inverse kinematics for a quantized target pose."""
+    
     try:
-        # Convert orientation to radians
-        phi = math.radians(phi_deg)
-        
-        # Step 1: Calculate wrist position
-        # The wrist is located at distance l3 away from the end-effector,
-        # in the direction opposite to the final orientation
-        wx = px - l3 * math.cos(phi)
-        wy = py - l3 * math.sin(phi)
-        
-        # Convert to relative coordinates from base
-        wx_rel = wx - x0
-        wy_rel = wy - y0
-        
-        # Step 2: Solve for second joint angle (beta)
-        # Using the law of cosines for the triangle formed by l1, l2, and wrist distance
-        wrist_distance_sq = wx_rel**2 + wy_rel**2
-        wrist_distance = math.sqrt(wrist_distance_sq)
-        
-        # Check if wrist position is reachable by first two links
-        if wrist_distance > (l1 + l2):
-            return 0, 0, 0, False, f"Wrist too far (d={wrist_distance:.1f}cm > {l1+l2}cm)"
-        if wrist_distance < abs(l1 - l2):
-            return 0, 0, 0, False, f"Wrist too close (d={wrist_distance:.1f}cm < {abs(l1-l2)}cm)"
-        
-        c2 = (wrist_distance_sq - l1**2 - l2**2) / (2 * l1 * l2)
-        
-        # Numerical stability check
-        if abs(c2) > 1:
-            c2 = max(-1, min(1, c2))  # Clamp to valid range
-        
-        # Calculate sine of second joint angle (choosing elbow-up configuration)
-        s2 = math.sqrt(1 - c2**2)
-        
-        # Second joint angle (negative for elbow-up configuration)
-        beta = -math.atan2(s2, c2)
+        status, alpha_deg, beta_deg, gamma_deg, wrist_distance = _ik_kernel(
+            float(px), float(py), float(phi_deg), *_IK_GEOMETRY)
         
-        # Step 3: Solve for first joint angle (alpha)
-        # Using the relationship between joint angles and wrist position
-        denominator = wrist_distance_sq
-        
-        if denominator < 1e-6:  # Avoid division by zero
+        # Translate the kernel status code into a user-facing message
+        if status == IK_TOO_FAR:
+            return 0, 0, 0, False, f"Wrist too far (d={wrist_distance:.1f}cm > {_REACH_MAX}cm)"
+        if status == IK_TOO_CLOSE:
+            return 0, 0, 0, False, f"Wrist too close (d={wrist_distance:.1f}cm < {_REACH_MIN}cm)"
+        if status == IK_SINGULAR:
             return 0, 0, 0, False, "Wrist at origin - singular configuration"
         
-        c1 = ((l1 + l2 * c2) * wx_rel - l2 * s2 * wy_rel) / denominator
-        s1 = ((l1 + l2 * c2) * wy_rel + l2 * s2 * wx_rel) / denominator
-        
-        # First joint angle
-        alpha = math.atan2(s1, c1)
-        
-        # Step 4: Calculate third joint angle (gamma)
-        # Third joint compensates to achieve the desired final orientation
-        gamma = phi - (alpha + beta)
-        
-        # Convert to degrees
-        alpha_deg = math.degrees(alpha)
-        beta_deg = math.degrees(beta)
-        gamma_deg = math.degrees(gamma)
-        
         return alpha_deg, beta_deg, gamma_deg, True, "Solution found"
         
     except Exception as e:
         return 0, 0, 0, False, f"Calculation error: {str(e)}"
 
+@njit(cache=True, fastmath=True, error_model='numpy')
+def _ik_kernel(px, py, phi_deg, x0, y0, l1, l2, l3,
+               reach_max, reach_min, l1_sq, l2_sq, two_l1l2):
+    """
+    Numerical core of the inverse kinematics solver.
+    
+    The arm geometry and its precomputed link-length terms are passed in
+    (see _IK_GEOMETRY) rather than read from module constants, which a
+    compiled kernel would freeze; the Cython ik_kernel takes the same
+    arguments.
+    
+    Returns:
+    --------
+    tuple: (status, alpha_deg, beta_deg, gamma_deg, wrist_distance)
+        status is one of the IK_* codes; angles are only valid for IK_OK
+    """
+    
+    # Convert orientation to radians
+    phi = math.radians(phi_deg)
+    
+    # Step 1: Calculate wrist position
+    # The wrist is located at distance l3 away from the end-effector,
+    # in the direction opposite to the final orientation
+    wx = px - l3 * math.cos(phi)
+    wy = py - l3 * math.sin(phi)
+    
+    # Convert to relative coordinates from base
+    wx_rel = wx - x0
+    wy_rel = wy - y0
+    
+    # Step 2: Solve for second joint angle (beta)
+    # Using the law of cosines for the triangle formed by l1, l2, and wrist distance
+    wrist_distance_sq = wx_rel**2 + wy_rel**2
+    wrist_distance = math.sqrt(wrist_distance_sq)
+    
+    # Check if wrist position is reachable by first two links
+    if wrist_distance > reach_max:
+        return IK_TOO_FAR, 0.0, 0.0, 0.0, wrist_distance
+    if wrist_distance < reach_min:
+        return IK_TOO_CLOSE, 0.0, 0.0, 0.0, wrist_distance
+    
+    c2 = (wrist_distance_sq - l1_sq - l2_sq) / two_l1l2
+    
+    # Numerical stability check
+    if abs(c2) > 1:
+        c2 = max(-1.0, min(1.0, c2))  # Clamp to valid range
+    
+    # Calculate sine of second joint angle (choosing elbow-up configuration)
+    s2 = math.sqrt(1 - c2**2)
+    
+    # Second joint angle (negative for elbow-up configuration)
+    beta = -math.atan2(s2, c2)
+    
+    # Step 3: Solve for first joint angle (alpha)
+    # Using the relationship between joint angles and wrist position
+    denominator = wrist_distance_sq
+    
+    if denominator < 1e-6:  # Avoid division by zero
+        return IK_SINGULAR, 0.0, 0.0, 0.0, wrist_distance
+    
+    c1 = ((l1 + l2 * c2) * wx_rel - l2 * s2 * wy_rel) / denominator
+    s1 = ((l1 + l2 * c2) * wy_rel + l2 * s2 * wx_rel) / denominator
+    
+    # First joint angle
+    alpha = math.atan2(s1, c1)
+    
+    # Step 4: Calculate third joint angle (gamma)
+    # Third joint compensates to achieve the desired final orientation
+    gamma = phi - (alpha + beta)
+    
+    # Convert to degrees
+    return IK_OK, math.degrees(alpha), math.degrees(beta), math.degrees(gamma), wrist_distance
+
+# Prefer the Cython build of the kernel when it is available
+if _compiled_kinematics is not None:
+    _ik_kernel = _compiled_kinematics.ik_kernel
+
+# Compile the kernel at import time so the first Calculate click is not delayed
+_ik_kernel(float(x0 + l1 + l2), float(y0 + l3), 90.0, *_IK_GEOMETRY)
+
+def solve_inverse_kinematics_batch(px, py, phi_deg):
+    """
+    Solve inverse kinematics for many target poses at once.
+    
+    Vectorized counterpart of solve_inverse_kinematics() for trajectories
+    and workspace analyses: every step is evaluated on whole arrays, and
+    unreachable poses are masked out instead of returning early.
+    
+    Parameters:
+    -----------
+    px, py : array_like
+        Target end-effector coordinates
+    phi_deg : array_like
+        Desired end-effector orientations in degrees
+        (inputs are broadcast against each other)
+        
+    Returns:
+    --------
+    tuple: (alpha_deg, beta_deg, gamma_deg, success)
+        Arrays of joint angles in degrees (0 where no solution exists)
+        and a boolean mask of the poses that were solved
+    """
+    
+    px, py, phi_deg = np.broadcast_arrays(np.asarray(px, dtype=np.float64),
+                                          np.asarray(py, dtype=np.float64),
+                                          np.asarray(phi_deg, dtype=np.float64))
+    phi = np.deg2rad(phi_deg)
+    
+    # Wrist positions relative to the base
+    wx_rel = px - l3 * np.cos(phi) - x0
+    wy_rel = py - l3 * np.sin(phi) - y0
+    wrist_distance_sq = wx_rel**2 + wy_rel**2
+    wrist_distance = np.sqrt(wrist_distance_sq)
+    
+    # Same reachability and singularity checks as the scalar solver
+    success = ((wrist_distance <= _REACH_MAX) &
+               (wrist_distance >= _REACH_MIN) &
+               (wrist_distance_sq >= 1e-6))
+    
+    # Law of cosines for the second joint (elbow-up configuration)
+    c2 = np.clip((wrist_distance_sq - _L1_SQ - _L2_SQ) / _TWO_L1L2, -1, 1)
+    s2 = np.sqrt(1 - c2**2)
+    beta = -np.arctan2(s2, c2)
+    
+    # First joint from the wrist position; masked entries may divide by zero
+    with np.errstate(invalid='ignore', divide='ignore'):
+        c1 = ((l1 + l2 * c2) * wx_rel - l2 * s2 * wy_rel) / wrist_distance_sq
+        s1 = ((l1 + l2 * c2) * wy_rel + l2 * s2 * wx_rel) / wrist_distance_sq
+    alpha = np.arctan2(s1, c1)
+    
+    # Third joint compensates to achieve the desired final orientation
+    gamma = phi - (alpha + beta)
+    
+    alpha_deg = np.where(success, np.rad2deg(alpha), 0.0)
+    beta_deg = np.where(success, np.rad2deg(beta), 0.0)
+    gamma_deg = np.where(success, np.rad2deg(gamma), 0.0)
+    
+    return alpha_deg, beta_deg, gamma_deg, success
+
 #===============================================================================
-# FORWARD KINEMATICS FOR VERIFICATION
+# WORKSPACE REACHABILITY MAP
 #===============================================================================
 
-def calculate_arm_position(alpha_deg, beta_deg, gamma_deg):
-    """Calculate forward kinematics to verify the solution."""
+# Grid covering the plot area, sampled at cell centres
+reach_resolution = 0.5  # Grid spacing (cm)
+reach_extent = (x0 - plot_limit, x0 + plot_limit, y0 - plot_limit, y0 + plot_limit)
+_reach_offsets = np.arange(-plot_limit, plot_limit, reach_resolution) + reach_resolution / 2
+_reach_px, _reach_py = np.meshgrid(x0 + _reach_offsets, y0 + _reach_offsets)
+
+@functools.lru_cache(maxsize=64)
+def compute_reachability_map(phi_deg):
+    """
+    Compute which points of the plot area are reachable at a given orientation.
+    
+    Parameters:
+    -----------
+    phi_deg : float
+        End-effector orientation in degrees (callers should round it, since
+        results are cached per value)
+        
+    Returns:
+    --------
+    numpy.ndarray: boolean grid (rows along Y, columns along X) spanning
+        reach_extent, True where the wrist is reachable by the first two links
+    """
     
-    # Convert to radians
-    alpha = math.radians(alpha_deg)
-    beta = math.radians(beta_deg)
-    gamma = math.radians(gamma_deg)
+    phi = math.radians(phi_deg)
     
-    # Calculate joint positions
-    x1 = x0 + l1 * math.cos(alpha)
-    y1 = y0 + l1 * math.sin(alpha)
+    # Wrist position for every grid point at once
+    wrist_distance = np.hypot(_reach_px - l3 * math.cos(phi) - x0,
+                              _reach_py - l3 * math.sin(phi) - y0)
     
-    x2 = x1 + l2 * math.cos(alpha + beta)
-    y2 = y1 + l2 * math.sin(alpha + beta)
+    reachable = (wrist_distance <= _REACH_MAX) & (wrist_distance >= _REACH_MIN)
     
-    x3 = x2 + l3 * math.cos(alpha + beta + gamma)
-    y3 = y2 + l3 * math.sin(alpha + beta + gamma)
+    # Cached arrays are shared between callers, so protect them from mutation
+    reachable.setflags(write=False)
+    return reachable
+
+#===============================================================================
+# TRIGONOMETRIC LOOKUP TABLE
+#===============================================================================
+
+# Cosine/sine of every whole degree in [-540, 540], which covers the
+# cumulative angle of three joints limited to [-180, 180] each. Kept as
+# Python lists: indexing a list with a scalar is much cheaper than indexing
+# a numpy array
+_ANGLE_OFFSET = 540
+_COS = np.cos(np.deg2rad(np.arange(-_ANGLE_OFFSET, _ANGLE_OFFSET + 1, dtype=np.float64))).tolist()
+_SIN = np.sin(np.deg2rad(np.arange(-_ANGLE_OFFSET, _ANGLE_OFFSET + 1, dtype=np.float64))).tolist()
+_TABLE_SIZE = len(_COS)
+
+def _link_cos_sin(alpha, beta, gamma):
+    """
+    Cosine and sine of the cumulative link angles alpha, alpha + beta and
+    alpha + beta + gamma (all in degrees), as two tuples of floats.
+    """
     
-    return [x0, x1, x2, x3], [y0, y1, y2, y3]
+    # Fast path: integer angles whose cumulative sums fall inside the table.
+    # The type check is the cheapest test that lets non-integer angles skip
+    # straight to the math functions below
+    if type(alpha) is int and type(beta) is int and type(gamma) is int:
+        i1 = alpha + _ANGLE_OFFSET
+        i2 = i1 + beta
+        i3 = i2 + gamma
+        if 0 <= i1 < _TABLE_SIZE and 0 <= i2 < _TABLE_SIZE and 0 <= i3 < _TABLE_SIZE:
+            return (_COS[i1], _COS[i2], _COS[i3]), (_SIN[i1], _SIN[i2], _SIN[i3])
+    
+    # Otherwise evaluate each joint once and build the cumulative angles
+    # with the angle-addition identities
+    alpha_rad = math.radians(alpha)
+    beta_rad = math.radians(beta)
+    gamma_rad = math.radians(gamma)
+    ca, sa = math.cos(alpha_rad), math.sin(alpha_rad)
+    cb, sb = math.cos(beta_rad), math.sin(beta_rad)
+    cg, sg = math.cos(gamma_rad), math.sin(gamma_rad)
+    
+    cab = ca * cb - sa * sb     # cos(alpha + beta)
+    sab = sa * cb + ca * sb     # sin(alpha + beta)
+    cabg = cab * cg - sab * sg  # cos(alpha + beta + gamma)
+    sabg = sab * cg + cab * sg  # sin(alpha + beta + gamma)
+    
+    return (ca, cab, cabg), (sa, sab, sabg)
+
+#===============================================================================
+# FORWARD KINEMATICS FOR VERIFICATION
+#===============================================================================
+
+def calculate_arm_position(alpha_deg, beta_deg, gamma_deg, out=None):
+    """
+    Calculate forward kinematics to verify the solution.
+    
+    If given, the (2, 4) float64 buffer `out` is filled in place with the
+    joint x (row 0) and y (row 1) coordinates, and views of its rows are
+    returned.
+    """
+    
+    if out is None:
+        out = np.empty((2, 4))
+    
+    if _compiled_kinematics is not None:
+        _compiled_kinematics.forward_kinematics(alpha_deg, beta_deg, gamma_deg,
+                                                x0, y0, l1, l2, l3, out)
+        return out[0], out[1]
+    
+    # Cumulative link angles
+    (c1, c2, c3), (s1, s2, s3) = _link_cos_sin(alpha_deg, beta_deg, gamma_deg)
+    
+    # Calculate joint positions as scalars and store them directly; per-call
+    # array temporaries cost far more than the arithmetic for three links
+    x1 = x0 + l1 * c1
+    y1 = y0 + l1 * s1
+    x2 = x1 + l2 * c2
+    y2 = y1 + l2 * s2
+    
+    out[0, 0] = x0
+    out[1, 0] = y0
+    out[0, 1] = x1
+    out[1, 1] = y1
+    out[0, 2] = x2
+    out[1, 2] = y2
+    out[0, 3] = x2 + l3 * c3
+    out[1, 3] = y2 + l3 * s3
+    
+    return out[0], out[1]
 
 #===============================================================================
 # INTERACTIVE VISUALIZATION
 #===============================================================================
 
+def _arm_segments(joints):
+    """Convert a (2, N) joint coordinates array into N-1 link segments."""
+    points = joints.T
+    return np.stack([points[:-1], points[1:]], axis=1)
+
 def create_interactive_ik_solver():
     """
     Create the interactive inverse kinematics solver interface.
     """
     
+    # Matplotlib is only needed for the GUI, so the kinematics functions can be
+    # imported without paying for the plotting stack
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    from matplotlib.widgets import TextBox, Button
+    
     # Create figure and axis
     fig, ax = plt.subplots(figsize=(14, 10))
     plt.subplots_adjust(bottom=0.25, right=0.75)  # Make room for input boxes and info
@@ -177,16 +419,23 @@ def create_interactive_ik_solver():
     alpha, beta, gamma, success, msg = solve_inverse_kinematics(
         current_values['px'], current_values['py'], current_values['phi'])
     
+    # Joint coordinates buffer (row 0: x, row 1: y), reused on every update
+    joints = np.empty((2, 4))
+    
     # Calculate initial arm position
     if success:
-        arm_x, arm_y = calculate_arm_position(alpha, beta, gamma)
+        arm_x, arm_y = calculate_arm_position(alpha, beta, gamma, out=joints)
     else:
-        arm_x, arm_y = [x0, x0, x0, x0], [y0, y0, y0, y0]
+        joints[0] = x0
+        joints[1] = y0
+        arm_x, arm_y = joints[0], joints[1]
     
     # Create plots
-    # Arm links
-    line, = ax.plot(arm_x, arm_y, '-o', 
-                   linewidth=3, markersize=8, color='royalblue', label='Arm')
+    # Arm links (one batched collection) and joint markers
+    arm_links = LineCollection(_arm_segments(joints), linewidths=3,
+                               colors='royalblue', label='Arm')
+    ax.add_collection(arm_links)
+    arm_joints = ax.scatter(arm_x, arm_y, s=8**2, color='royalblue', zorder=2)
     
     # Base marker
     ax.plot(x0, y0, 'o', markersize=12, color='red', label='Base')
@@ -196,14 +445,23 @@ def create_interactive_ik_solver():
                            markersize=12, color='orange', label='Target')
     
     # Target orientation indicator (arrow)
-    phi_rad = math.radians(current_values['phi'])
     arrow_length = 8
-    target_arrow = ax.annotate('', 
-                              xy=(current_values['px'] + arrow_length * math.cos(phi_rad),
-                                  current_values['py'] + arrow_length * math.sin(phi_rad)),
-                              xytext=(current_values['px'], current_values['py']),
-                              arrowprops=dict(arrowstyle='->', 
-                                            color='orange', lw=2))
+    
+    def arrow_vector(phi_deg):
+        """
+        Arrow (dx, dy) for an orientation: [arrow_length, 0] rotated by phi.
+        The 2D rotation matrix [[c, -s], [s, c]] applied to that vector
+        reduces to its first column, so only c and s are needed.
+        """
+        phi_rad = math.radians(phi_deg)
+        c, s = math.cos(phi_rad), math.sin(phi_rad)
+        return arrow_length * c, arrow_length * s
+    
+    arrow_dx, arrow_dy = arrow_vector(current_values['phi'])
+    target_arrow = ax.quiver([current_values['px']], [current_values['py']],
+                             [arrow_dx], [arrow_dy],
+                             angles='xy', scale_units='xy', scale=1,
+                             color='orange', width=0.004)
     
     # Workspace circle (maximum reach)
     workspace_circle = plt.Circle((x0, y0), max_reach, 
@@ -211,6 +469,12 @@ def create_interactive_ik_solver():
                                  color='gray', alpha=0.5, label='Max workspace')
     ax.add_patch(workspace_circle)
     
+    # Reachable region for the current orientation (recomputed when phi changes)
+    reach_phi = round(current_values['phi'], 1)
+    reach_image = ax.imshow(compute_reachability_map(reach_phi), extent=reach_extent,
+                            origin='lower', cmap='Greens', vmin=0, vmax=1,
+                            alpha=0.15, interpolation='nearest', zorder=0)
+    
     # Configure plot with dynamic limits based on arm reach
     ax.set_xlim(x0 - plot_limit, x0 + plot_limit)
     ax.set_ylim(y0 - plot_limit, y0 + plot_limit)
@@ -229,37 +493,20 @@ def create_interactive_ik_solver():
     
     input_height = 0.04
     input_width = 0.15
-    label_width = 0.1
     
-    # Input box positions
-    ax_px_label = plt.axes([0.05, 0.15, label_width, input_height])
     # Position sliders with dynamic range based on workspace
     max_coord = int(x0 + max_reach)
     min_coord = int(x0 - max_reach)
 
     # Input box positions
-    ax_px_label = plt.axes([0.05, 0.15, label_width, input_height])
     ax_px = plt.axes([0.16, 0.15, input_width, input_height])
-    
-    ax_py_label = plt.axes([0.05, 0.10, label_width, input_height])
     ax_py = plt.axes([0.16, 0.10, input_width, input_height])
-    
-    ax_phi_label = plt.axes([0.05, 0.05, label_width, input_height])
     ax_phi = plt.axes([0.16, 0.05, input_width, input_height])
     
-
-    # Create labels
-    ax_px_label.text(0.5, 0.5, 'Target X (cm):', ha='center', va='center', transform=ax_px_label.transAxes)
-    ax_px_label.set_xticks([])
-    ax_px_label.set_yticks([])
-    
-    ax_py_label.text(0.5, 0.5, 'Target Y (cm):', ha='center', va='center', transform=ax_py_label.transAxes)
-    ax_py_label.set_xticks([])
-    ax_py_label.set_yticks([])
-    
-    ax_phi_label.text(0.5, 0.5, 'Orient. φ (°):', ha='center', va='center', transform=ax_phi_label.transAxes)
-    ax_phi_label.set_xticks([])
-    ax_phi_label.set_yticks([])
+    # Create labels (plain figure text, centred left of each input box)
+    fig.text(0.10, 0.17, 'Target X (cm):', ha='center', va='center', fontsize=10)
+    fig.text(0.10, 0.12, 'Target Y (cm):', ha='center', va='center', fontsize=10)
+    fig.text(0.10, 0.07, 'Orient. φ (°):', ha='center', va='center', fontsize=10)
 
     # Create text input boxes
     textbox_px = TextBox(ax_px, '', initial=str(current_values['px']))
@@ -279,29 +526,92 @@ def create_interactive_ik_solver():
                              bbox=dict(boxstyle="round,pad=0.3", 
                                      facecolor="lightgreen", alpha=0.8))
     
+    info_template = (
+        "TARGET:\n"
+        "Position: (%.1f, %.1f) cm\n"
+        "Orientation: %.0f°\n\n"
+        "JOINT ANGLES:\n"
+        "α = %6.1f°\n"
+        "β = %6.1f°\n" 
+        "γ = %6.1f°\n\n"
+        "WORKSPACE:\n"
+        f"Max reach: {max_reach} cm\n"
+        "Target dist: %.1f cm"
+    )
+    
+    # Last displayed contents, used to skip redundant text/bbox updates
+    last_info = None
+    last_status = None
+    
+    def set_status(success, msg):
+        """Show a status message, colored by success."""
+        nonlocal last_status
+        
+        if (success, msg) == last_status:
+            return
+        last_status = (success, msg)
+        
+        status_color = "lightgreen" if success else "lightcoral"
+        status_text.set_bbox(dict(boxstyle="round,pad=0.3", 
+                                facecolor=status_color, alpha=0.8))
+        status_text.set_text("STATUS:\n%s" % msg)
+    
     def update_info_display(px, py, phi, alpha, beta, gamma, success, msg):
         """Update the information display with current values."""
+        nonlocal last_info
         
-        info_content = (
-            f"TARGET:\n"
-            f"Position: ({px:.1f}, {py:.1f}) cm\n"
-            f"Orientation: {phi:.0f}°\n\n"
-            f"JOINT ANGLES:\n"
-            f"α = {alpha:6.1f}°\n"
-            f"β = {beta:6.1f}°\n" 
-            f"γ = {gamma:6.1f}°\n\n"
-            f"WORKSPACE:\n"
-            f"Max reach: {max_reach} cm\n"
-            f"Target dist: {math.sqrt((px-x0)**2 + (py-y0)**2):.1f} cm"
-        )
+        info_content = info_template % (px, py, phi, alpha, beta, gamma,
+                                        math.hypot(px - x0, py - y0))
         
-        info_text.set_text(info_content)
+        if info_content != last_info:
+            info_text.set_text(info_content)
+            last_info = info_content
         
         # Status message
-        status_color = "lightgreen" if success else "lightcoral"
-        status_text.set_bbox(dict(boxstyle="round,pad=0.3", 
-                                facecolor=status_color, alpha=0.8))
-        status_text.set_text(f"STATUS:\n{msg}")
+        set_status(success, msg)
+    
+    #===========================================================================
+    # BLITTING SETUP
+    #===========================================================================
+    
+    # Updates only redraw the moving artists; the static parts of the figure
+    # are restored from a background cached after each full draw
+    canvas = fig.canvas
+    use_blit = canvas.supports_blit
+    animated_artists = (arm_links, arm_joints, target_point, target_arrow, info_text, status_text)
+    for artist in animated_artists:
+        artist.set_animated(use_blit)
+    background = None
+    
+    def draw_animated():
+        """Draw the artists that are excluded from the cached background."""
+        for artist in animated_artists:
+            fig.draw_artist(artist)
+    
+    def on_draw(event):
+        """Refresh the cached background after every full redraw (e.g. resize)."""
+        nonlocal background
+        if event.canvas is not canvas:
+            # savefig to another format renders through a temporary canvas:
+            # include the animated artists, but keep the cached background
+            for artist in animated_artists:
+                artist.draw(event.renderer)
+            return
+        background = canvas.copy_from_bbox(fig.bbox)
+        draw_animated()
+    
+    # Without blit support nothing is animated and updates use draw_idle()
+    if use_blit:
+        canvas.mpl_connect('draw_event', on_draw)
+    
+    def redraw():
+        """Blit the animated artists, or fall back to a full redraw."""
+        if background is None:
+            canvas.draw_idle()
+        else:
+            canvas.restore_region(background)
+            draw_animated()
+            canvas.blit(fig.bbox)
     
     #===========================================================================
     # UPDATE FUNCTION
@@ -309,7 +619,7 @@ def create_interactive_ik_solver():
     
     def update_solver():
         """Update the solver when input values change."""
-        nonlocal target_arrow  # Declare nonlocal at the beginning
+        nonlocal reach_phi
         
         px = current_values['px']
         py = current_values['py']
@@ -319,36 +629,60 @@ def create_interactive_ik_solver():
         alpha, beta, gamma, success, msg = solve_inverse_kinematics(px, py, phi)
         
         # Update target point and arrow
-        target_point.set_xdata([px])
-        target_point.set_ydata([py])
+        target_point.set_data([px], [py])
         
-        phi_rad = math.radians(phi)
-        target_arrow.remove()
-        new_arrow = ax.annotate('', 
-                               xy=(px + arrow_length * math.cos(phi_rad),
-                                   py + arrow_length * math.sin(phi_rad)),
-                               xytext=(px, py),
-                               arrowprops=dict(arrowstyle='->', 
-                                             color='orange', lw=2))
+        arrow_dx, arrow_dy = arrow_vector(phi)
+        target_arrow.set_offsets([[px, py]])
+        target_arrow.set_UVC([arrow_dx], [arrow_dy])
         
         # Update arm position if solution exists
         if success:
-            arm_x, arm_y = calculate_arm_position(alpha, beta, gamma)
-            line.set_xdata(arm_x)
-            line.set_ydata(arm_y)
-            line.set_color('royalblue')
+            calculate_arm_position(alpha, beta, gamma, out=joints)
+            arm_links.set_segments(_arm_segments(joints))
+            arm_joints.set_offsets(joints.T)
+            arm_links.set_color('royalblue')
+            arm_joints.set_color('royalblue')
         else:
             # Show arm in error state (red)
-            line.set_color('red')
+            arm_links.set_color('red')
+            arm_joints.set_color('red')
         
         # Update information display
         update_info_display(px, py, phi, alpha, beta, gamma, success, msg)
         
-        # Update the global arrow reference
-        target_arrow = new_arrow
-        
-        # Redraw
-        fig.canvas.draw_idle()
+        # Redraw; the reachability map is part of the static background, so
+        # a new orientation needs a full redraw to refresh it
+        if round(phi, 1) != reach_phi:
+            reach_phi = round(phi, 1)
+            reach_image.set_data(compute_reachability_map(reach_phi))
+            canvas.draw_idle()
+        else:
+            redraw()
+    
+    #===========================================================================
+    # EVENT THROTTLING
+    #===========================================================================
+    
+    # Coalesce repeated update requests so the solver runs and redraws at most
+    # once per display frame (~60 Hz)
+    update_pending = False
+    
+    def run_pending_update():
+        """Timer callback: solve for the latest target values."""
+        nonlocal update_pending
+        update_pending = False
+        update_solver()
+    
+    update_timer = canvas.new_timer(interval=16)
+    update_timer.single_shot = True
+    update_timer.add_callback(run_pending_update)
+    
+    def schedule_update():
+        """Defer the solver update to the next frame boundary."""
+        nonlocal update_pending
+        if not update_pending:
+            update_pending = True
+            update_timer.start()
     
     #===========================================================================
     # INPUT HANDLERS
@@ -404,7 +738,7 @@ def create_interactive_ik_solver():
         textbox_py.set_val(str(current_values['py']))
         textbox_phi.set_val(str(current_values['phi']))
         
-        update_solver()
+        schedule_update()
     
     button_reset.on_clicked(reset_solver)
     
@@ -419,13 +753,11 @@ def create_interactive_ik_solver():
             current_values['px'] = float(textbox_px.text)
             current_values['py'] = float(textbox_py.text)
             current_values['phi'] = float(textbox_phi.text)
-            update_solver()
+            schedule_update()
         except ValueError:
             # Show error in status if invalid input
-            status_text.set_bbox(dict(boxstyle="round,pad=0.3", 
-                                    facecolor="lightcoral", alpha=0.8))
-            status_text.set_text("STATUS:\nInvalid input values!\nCheck your numbers.")
-            fig.canvas.draw_idle()
+            set_status(False, "Invalid input values!\nCheck your numbers.")
+            redraw()
     
     button_calc.on_clicked(manual_calculate)
     
@@ -442,6 +774,7 @@ def create_interactive_ik_solver():
         "• Orange square: Target point\n"
         "• Orange arrow: Target orientation\n"
         "• Dashed circle: Workspace limit\n"
+        "• Green area: Reachable at target φ\n"
         "• Blue arm: Valid solution\n"
         "• Red arm: Unreachable position\n\n"
         "EXAMPLES:\n"
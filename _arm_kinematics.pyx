@@ -0,0 +1,128 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+
+"""
+Compiled kinematics kernels for the 3-DOF robotic arm tools (optional)
+
+This module is an ahead-of-time compiled version of the scalar kinematics
+math used by the inverse kinematics solver. The solver imports it when it
+has been built and falls back to its own pure-Python implementation
+otherwise.
+
+Build in place (next to the two programs):
+    pip install cython
+    cythonize -i _arm_kinematics.pyx
+
+The arm geometry is passed in by the caller, so the configuration section
+at the top of each program remains the single place to change it.
+"""
+
+from libc.math cimport atan2, cos, sin, sqrt, M_PI
+
+#===============================================================================
+# INVERSE KINEMATICS STATUS CODES - MUST MATCH THE INTERACTIVE PROGRAMS
+#===============================================================================
+
+IK_OK = 0         # Solution found
+IK_TOO_FAR = 1    # Wrist beyond reach of the first two links
+IK_TOO_CLOSE = 2  # Wrist inside the inner dead zone of the first two links
+IK_SINGULAR = 3   # Wrist at the base - singular configuration
+
+cdef double DEG_TO_RAD = M_PI / 180.0
+cdef double RAD_TO_DEG = 180.0 / M_PI
+
+#===============================================================================
+# FORWARD KINEMATICS
+#===============================================================================
+
+cpdef void forward_kinematics(double alpha_deg, double beta_deg, double gamma_deg,
+                              double x0, double y0,
+                              double l1, double l2, double l3,
+                              double[:, ::1] out):
+    """
+    Calculate the joint positions of the arm into a (2, 4) float64 buffer.
+
+    Row 0 of `out` receives the x coordinates and row 1 the y coordinates
+    of the base, both intermediate joints and the end-effector.
+    """
+
+    cdef double ca = cos(alpha_deg * DEG_TO_RAD)
+    cdef double sa = sin(alpha_deg * DEG_TO_RAD)
+    cdef double cb = cos(beta_deg * DEG_TO_RAD)
+    cdef double sb = sin(beta_deg * DEG_TO_RAD)
+    cdef double cg = cos(gamma_deg * DEG_TO_RAD)
+    cdef double sg = sin(gamma_deg * DEG_TO_RAD)
+
+    # Cumulative link angles via the angle-addition identities
+    cdef double cab = ca * cb - sa * sb
+    cdef double sab = sa * cb + ca * sb
+    cdef double cabg = cab * cg - sab * sg
+    cdef double sabg = sab * cg + cab * sg
+
+    out[0, 0] = x0
+    out[1, 0] = y0
+    out[0, 1] = out[0, 0] + l1 * ca
+    out[1, 1] = out[1, 0] + l1 * sa
+    out[0, 2] = out[0, 1] + l2 * cab
+    out[1, 2] = out[1, 1] + l2 * sab
+    out[0, 3] = out[0, 2] + l3 * cabg
+    out[1, 3] = out[1, 2] + l3 * sabg
+
+#===============================================================================
+# INVERSE KINEMATICS
+#===============================================================================
+
+cpdef tuple ik_kernel(double px, double py, double phi_deg,
+                      double x0, double y0,
+                      double l1, double l2, double l3,
+                      double reach_max, double reach_min,
+                      double l1_sq, double l2_sq, double two_l1l2):
+    """
+    Numerical core of the inverse kinematics solver.
+    
+    reach_max, reach_min, l1_sq, l2_sq and two_l1l2 are the link-length
+    terms l1 + l2, |l1 - l2|, l1**2, l2**2 and 2*l1*l2, precomputed once by
+    the caller.
+
+    Returns:
+    --------
+    tuple: (status, alpha_deg, beta_deg, gamma_deg, wrist_distance)
+        status is one of the IK_* codes; angles are only valid for IK_OK
+    """
+
+    cdef double phi = phi_deg * DEG_TO_RAD
+
+    # Wrist position relative to the base
+    cdef double wx_rel = px - l3 * cos(phi) - x0
+    cdef double wy_rel = py - l3 * sin(phi) - y0
+
+    cdef double wrist_distance_sq = wx_rel * wx_rel + wy_rel * wy_rel
+    cdef double wrist_distance = sqrt(wrist_distance_sq)
+
+    # Check if wrist position is reachable by first two links
+    if wrist_distance > reach_max:
+        return IK_TOO_FAR, 0.0, 0.0, 0.0, wrist_distance
+    if wrist_distance < reach_min:
+        return IK_TOO_CLOSE, 0.0, 0.0, 0.0, wrist_distance
+
+    # Law of cosines for the second joint (elbow-up configuration)
+    cdef double c2 = (wrist_distance_sq - l1_sq - l2_sq) / two_l1l2
+    if c2 > 1.0:
+        c2 = 1.0
+    elif c2 < -1.0:
+        c2 = -1.0
+    cdef double s2 = sqrt(1.0 - c2 * c2)
+    cdef double beta = -atan2(s2, c2)
+
+    if wrist_distance_sq < 1e-6:  # Avoid division by zero
+        return IK_SINGULAR, 0.0, 0.0, 0.0, wrist_distance
+
+    # First joint from the wrist position
+    cdef double c1 = ((l1 + l2 * c2) * wx_rel - l2 * s2 * wy_rel) / wrist_distance_sq
+    cdef double s1 = ((l1 + l2 * c2) * wy_rel + l2 * s2 * wx_rel) / wrist_distance_sq
+    cdef double alpha = atan2(s1, c1)
+
+    # Third joint compensates to achieve the desired final orientation
+    cdef double gamma = phi - (alpha + beta)
+
+    return (IK_OK, alpha * RAD_TO_DEG, beta * RAD_TO_DEG, gamma * RAD_TO_DEG,
+            wrist_distance)